@@ -39,6 +39,13 @@ def get_version(request: Request):
         raise HTTPException(status_code=503, detail="Predictor not loaded")
     return predictor.get_model_version()
 
+@app.get("/drift")
+def get_drift(request: Request):
+    predictor = getattr(request.app.state, "predictor", None)
+    if predictor is None:
+        raise HTTPException(status_code=503, detail="Predictor not loaded")
+    return predictor.monitor.snapshot()
+
 @app.post("/predict", response_model=TicketResponse)
 def predict_ticket(req: TicketRequest, request: Request):
 
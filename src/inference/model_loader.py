@@ -14,5 +14,9 @@ def load_latest_models():
         "severity_model": reg["severity"]["model"],
         "severity_encoder": reg["severity"]["encoder"],
         "sbert_model_name": reg["severity"]["sbert_model_name"],
+        "severity_backend": reg["severity"].get("backend", "sbert"),
+        "severity_distilled_vectorizer": reg["severity"].get("distilled", {}).get("vectorizer"),
+        "severity_distilled_model": reg["severity"].get("distilled", {}).get("model"),
+        "reference_profile": reg.get("monitoring", {}).get("reference_profile"),
         "version": reg["version"]
     }
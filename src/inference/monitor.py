@@ -0,0 +1,200 @@
+import json
+import math
+import os
+import random
+import threading
+
+# Confidence histograms use fixed-width bins over [0, 1]; the training scripts
+# write their reference histograms with the same number of bins.
+CONFIDENCE_BINS = 20
+
+# Reference profile section holding the severity distribution of each backend
+SEVERITY_REFERENCE_SECTIONS = {
+    "sbert": "severity",
+    "distilled": "severity_distilled",
+}
+
+# PSI thresholds commonly used for population drift
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+
+_EPS = 1e-4
+
+
+def load_reference_profile(path):
+    """Load the reference profile written by the training scripts; None if missing."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception as e:
+        raise RuntimeError(f"Error loading reference profile from {path}: {e}")
+
+
+def _bin_index(value):
+    return min(max(int(value * CONFIDENCE_BINS), 0), CONFIDENCE_BINS - 1)
+
+
+def write_reference_section(path, section, counts, confidences):
+    """
+    Write one section (label mix + confidence histogram) of the reference
+    profile, keeping the sections written by the other training scripts.
+    """
+    if not path:
+        raise ValueError("No reference profile path configured in the registry.")
+    # counts may be a dict or a pandas Series from value_counts()
+    counts = {str(k): int(v) for k, v in dict(counts).items()}
+    profile = load_reference_profile(path) or {}
+    histogram = [0] * CONFIDENCE_BINS
+    for conf in confidences:
+        histogram[_bin_index(conf)] += 1
+    profile[section] = {
+        "counts": counts,
+        "confidence_histogram": histogram,
+        "num_samples": sum(counts.values())
+    }
+    with open(path, "w") as f:
+        json.dump(profile, f, indent=2)
+
+
+def _psi(expected, actual):
+    """Population stability index between two count mappings (label -> count)."""
+    exp_total = sum(expected.values())
+    act_total = sum(actual.values())
+    if exp_total == 0 or act_total == 0:
+        return None
+    score = 0.0
+    for key in set(expected) | set(actual):
+        e = max(expected.get(key, 0) / exp_total, _EPS)
+        a = max(actual.get(key, 0) / act_total, _EPS)
+        score += (a - e) * math.log(a / e)
+    return score
+
+
+def _histogram_quantile(histogram, q):
+    """Estimate a quantile from a fixed-bin histogram by linear interpolation."""
+    total = sum(histogram)
+    if total == 0:
+        return None
+    target = q * total
+    seen = 0
+    width = 1.0 / len(histogram)
+    for i, count in enumerate(histogram):
+        if count and seen + count >= target:
+            return (i + (target - seen) / count) * width
+        seen += count
+    return 1.0
+
+
+def _status(score):
+    if score is None:
+        return "unknown"
+    if score >= PSI_SIGNIFICANT:
+        return "significant"
+    if score >= PSI_MODERATE:
+        return "moderate"
+    return "stable"
+
+
+class DriftMonitor:
+    """
+    Constant-memory monitor of live predictions.
+
+    Keeps label counters for category / severity, fixed-bin confidence
+    histograms and a reservoir sample of input texts, and scores them
+    against the reference profile with PSI. Severity is compared with the
+    reference section written for the active severity backend.
+    """
+
+    def __init__(self, reference=None, severity_backend="sbert", reservoir_size=200, max_text_chars=512, seed=None):
+        self.reference = reference or {}
+        self.reference_sections = {
+            "category": "category",
+            "severity": SEVERITY_REFERENCE_SECTIONS[severity_backend],
+        }
+        self.reservoir_size = reservoir_size
+        self.max_text_chars = max_text_chars
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.num_predictions = 0
+            self.label_counts = {"category": {}, "severity": {}}
+            self.confidence_histograms = {
+                "category": [0] * CONFIDENCE_BINS,
+                "severity": [0] * CONFIDENCE_BINS,
+            }
+            self.reservoir = []
+
+    def record(self, category, severity, category_confidence=None, severity_confidence=None, text=None):
+        """Update the sketches with one prediction. O(1) time and memory."""
+        with self._lock:
+            self.num_predictions += 1
+
+            for task, label, conf in (
+                ("category", category, category_confidence),
+                ("severity", severity, severity_confidence),
+            ):
+                counts = self.label_counts[task]
+                counts[label] = counts.get(label, 0) + 1
+                if conf is not None:
+                    self.confidence_histograms[task][_bin_index(conf)] += 1
+
+            # Reservoir sampling (Algorithm R)
+            if text is not None and self.reservoir_size > 0:
+                text = text[:self.max_text_chars]
+                if len(self.reservoir) < self.reservoir_size:
+                    self.reservoir.append(text)
+                else:
+                    j = self._rng.randrange(self.num_predictions)
+                    if j < self.reservoir_size:
+                        self.reservoir[j] = text
+
+    def _task_report(self, task):
+        live_counts = dict(self.label_counts[task])
+        live_hist = list(self.confidence_histograms[task])
+        ref = self.reference.get(self.reference_sections[task], {})
+        ref_counts = ref.get("counts", {})
+        ref_hist = ref.get("confidence_histogram")
+
+        label_drift = _psi(ref_counts, live_counts) if ref_counts else None
+        confidence_drift = None
+        if ref_hist and len(ref_hist) == CONFIDENCE_BINS:
+            confidence_drift = _psi(dict(enumerate(ref_hist)), dict(enumerate(live_hist)))
+
+        return {
+            "label_counts": live_counts,
+            "label_drift": label_drift,
+            "label_drift_status": _status(label_drift),
+            "confidence_quantiles": {
+                "p10": _histogram_quantile(live_hist, 0.1),
+                "p50": _histogram_quantile(live_hist, 0.5),
+                "p90": _histogram_quantile(live_hist, 0.9),
+            },
+            "reference_confidence_quantiles": {
+                "p10": _histogram_quantile(ref_hist, 0.1),
+                "p50": _histogram_quantile(ref_hist, 0.5),
+                "p90": _histogram_quantile(ref_hist, 0.9),
+            } if ref_hist else None,
+            "confidence_drift": confidence_drift,
+            "confidence_drift_status": _status(confidence_drift),
+        }
+
+    def snapshot(self):
+        """Return current drift scores and sketch summaries."""
+        with self._lock:
+            return {
+                "num_predictions": self.num_predictions,
+                "reference_loaded": bool(self.reference),
+                "category": self._task_report("category"),
+                "severity": self._task_report("severity"),
+                "text_sample_size": len(self.reservoir),
+            }
+
+    def sample(self):
+        """Return a copy of the reservoir sample of input texts (not served by the API)."""
+        with self._lock:
+            return list(self.reservoir)
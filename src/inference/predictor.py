@@ -4,6 +4,7 @@ import joblib
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from src.inference.model_loader import load_latest_models
+from src.inference.monitor import DriftMonitor, load_reference_profile
 
 def _safe_load(path):
     """Try joblib.load then pickle.load; raise descriptive error on failure."""
@@ -49,6 +50,14 @@ class Predictor:
             raise RuntimeError(f"Error loading category encoder: {e}")
 
         # Load severity model, encoder
+        # backend "sbert": SBERT embeddings + LR (teacher)
+        # backend "distilled": TF-IDF + LR student, no SBERT needed
+        self.severity_backend = self.registry.get("severity_backend", "sbert")
+        if self.severity_backend not in ("sbert", "distilled"):
+            raise ValueError(f"Unknown severity backend: {self.severity_backend}")
+
+        if self.severity_backend == "distilled":
+            sev_model_path = self.registry.get("severity_distilled_model")
 
         try:
             self.severity_model = _safe_load(sev_model_path)
@@ -60,15 +69,29 @@ class Predictor:
         except Exception as e:
             raise RuntimeError(f"Error loading severity encoder: {e}")    
 
-        try: 
-            self.sbert_model = SentenceTransformer(sbert_model_name)
-        except Exception as e:
-            raise RuntimeError(f"Error loading SBERT model: {e}")
+        self.sbert_model = None
+        self.severity_vectorizer = None
+        if self.severity_backend == "distilled":
+            try:
+                self.severity_vectorizer = _safe_load(self.registry.get("severity_distilled_vectorizer"))
+            except Exception as e:
+                raise RuntimeError(f"Error loading distilled severity vectorizer: {e}")
+        else:
+            try: 
+                self.sbert_model = SentenceTransformer(sbert_model_name)
+            except Exception as e:
+                raise RuntimeError(f"Error loading SBERT model: {e}")
 
         # Load label mappings
         self.categories = list(self.category_encoder.classes_)
         self.severity_map = {i: label for i, label in enumerate(self.severity_encoder.classes_)}
 
+        # Drift monitor, compared against the profile written at training time
+        self.monitor = DriftMonitor(
+            reference=load_reference_profile(self.registry.get("reference_profile")),
+            severity_backend=self.severity_backend
+        )
+
 
     def get_model_version(self):
         return self.registry.get('version', 'unknown')
@@ -79,14 +102,14 @@ class Predictor:
 
         try:
             # 正确的特征提取流程：
-            # 1. 先用SBERT模型获取文本嵌入
-            text_embedding = self.sbert_model.encode([text])
-            
-            # 2. 对类别分类使用TF-IDF向量化
+            # 1. 对类别分类使用TF-IDF向量化
             cat_features = self.category_vectorizer.transform([text])
 
-             # 3. 严重性分类使用SBERT嵌入
-            sev_features = text_embedding
+            # 2. 严重性分类使用SBERT嵌入，或蒸馏后学生模型的TF-IDF特征
+            if self.severity_backend == "distilled":
+                sev_features = self.severity_vectorizer.transform([text])
+            else:
+                sev_features = self.sbert_model.encode([text])
             
         except Exception as e:
             raise RuntimeError(f"Error during feature extraction: {e}")
@@ -97,18 +120,22 @@ class Predictor:
             sev_pred = self.severity_model.predict(sev_features)[0]
 
             # Confidence
+            cat_prob = sev_prob = None
             if hasattr(self.category_model, "predict_proba") and hasattr(self.severity_model, "predict_proba"):
                 cat_prob = np.max(self.category_model.predict_proba(cat_features))
                 sev_prob = np.max(self.severity_model.predict_proba(sev_features))
                 final_conf = float(np.mean([cat_prob, sev_prob]))
 
-            return {
+            result = {
                 "category": self.categories[cat_pred] if cat_pred < len(self.categories) else "Unknown",
                 "severity": self.severity_map[sev_pred] if sev_pred in self.severity_map else "Unknown",
                 "confidence": final_conf
             }
         except Exception as e:
             raise RuntimeError(f"Error during prediction: {e}")
+
+        self.monitor.record(result["category"], result["severity"], cat_prob, sev_prob, text)
+        return result
         
         
 
@@ -6,8 +6,15 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, confusion_matrix
 import pickle
 import os
+import sys
 import joblib
 
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.inference.model_loader import load_latest_models
+from src.inference.monitor import write_reference_section
+
 # Load dataset
 DATA_PATH = os.path.join("data", "train.csv")
 df = pd.read_csv(DATA_PATH)
@@ -89,5 +96,17 @@ if len(mistakes) > 0:
     error_by_class = mistakes.groupby("true_category").size()
     print("\nMisclassified by true category:")
     print(error_by_class)
+
+# 写入漂移监控的参考分布（类别占比 + 测试集置信度直方图）
+try:
+    write_reference_section(
+        load_latest_models()["reference_profile"],
+        "category",
+        category_counts,
+        clf_cat.predict_proba(X_test_vec).max(axis=1)
+    )
+except Exception as e:
+    raise RuntimeError(f"Error saving reference profile: {e}")
+
 print("\nTraining complete! Models saved in /models/")
 
@@ -7,9 +7,16 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report
 import pickle
 import os
+import sys
 import joblib
 from sentence_transformers import SentenceTransformer
 
+# add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.inference.model_loader import load_latest_models
+from src.inference.monitor import write_reference_section
+
 # Load dataset
 DATA_PATH = os.path.join("data", "train.csv")
 df = pd.read_csv(DATA_PATH)
@@ -21,6 +28,8 @@ for col in required_columns:
     if col not in df.columns:
         raise ValueError(f"Missing required column: {col}")
 
+severity_counts = df["severity"].value_counts()
+
 sev_encoder = LabelEncoder()
 df["severity"] = sev_encoder.fit_transform(df["severity"])
 
@@ -70,5 +79,16 @@ try:
 except Exception as e:
     raise RuntimeError(f"Error saving severity model or encoder: {e}")
 
+# write the drift-monitoring reference (severity mix + test-set confidence histogram)
+try:
+    write_reference_section(
+        load_latest_models()["reference_profile"],
+        "severity",
+        severity_counts,
+        clf_sev.predict_proba(X_test_s).max(axis=1)
+    )
+except Exception as e:
+    raise RuntimeError(f"Error saving reference profile: {e}")
+
 print("\nTraining complete! Models saved in /models/")
 
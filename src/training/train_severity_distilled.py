@@ -0,0 +1,194 @@
+import pandas as pd
+import numpy as np
+import json
+from sklearn.model_selection import train_test_split
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import classification_report
+import pickle
+import os
+import sys
+import time
+import joblib
+from sentence_transformers import SentenceTransformer
+
+# add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.inference.monitor import SEVERITY_REFERENCE_SECTIONS, write_reference_section
+
+# Distill the SBERT + LogisticRegression severity model (teacher) into a
+# TF-IDF + LogisticRegression student trained on the teacher's soft targets.
+# Run train_severity.py first.
+
+DATA_PATH = os.path.join("data", "train.csv")
+# Optional logged production text (column: text), labelled by the teacher only.
+# Nothing in this repo writes it; export it from the ticket logs.
+UNLABELED_PATH = os.path.join("data", "production_texts.csv")
+REGISTRY_PATH = os.path.join("models", "registry.json")
+
+# weight of the gold label vs. the teacher's soft targets on labelled rows
+HARD_LABEL_WEIGHT = 0.3
+
+# Load dataset
+df = pd.read_csv(DATA_PATH)
+if len(df) == 0:
+    raise ValueError("The training dataset is empty.")
+
+required_columns = {"text", "severity"}
+for col in required_columns:
+    if col not in df.columns:
+        raise ValueError(f"Missing required column: {col}")
+
+unlabeled_texts = []
+if os.path.exists(UNLABELED_PATH):
+    unlabeled_df = pd.read_csv(UNLABELED_PATH)
+    if "text" not in unlabeled_df.columns:
+        raise ValueError(f"Missing required column in {UNLABELED_PATH}: text")
+    unlabeled_texts = unlabeled_df["text"].dropna().astype(str).tolist()
+    print(f"Loaded {len(unlabeled_texts)} unlabeled production texts")
+
+# ------------------------------
+# Teacher: SBERT + LogisticRegression
+# ------------------------------
+with open(REGISTRY_PATH, "r") as f:
+    registry = json.load(f)
+sbert_model_name = registry["severity"]["sbert_model_name"]
+
+try:
+    teacher_clf = pickle.load(open(registry["severity"]["model"], "rb"))
+    sev_encoder = joblib.load(registry["severity"]["encoder"])
+    sbert = SentenceTransformer(sbert_model_name)
+except Exception as e:
+    raise RuntimeError(f"Error loading teacher model: {e}")
+
+y = sev_encoder.transform(df["severity"])
+num_classes = len(sev_encoder.classes_)
+
+# Same split as train_severity.py, so the test rows are unseen by both models
+train_idx, test_idx = train_test_split(
+    np.arange(len(df)),
+    test_size=0.2,
+    random_state=42,
+    stratify=y
+)
+texts = df["text"].astype(str).values
+X_train_text = texts[train_idx].tolist() + unlabeled_texts
+X_test_text = texts[test_idx].tolist()
+
+try:
+    teacher_probs = teacher_clf.predict_proba(sbert.encode(X_train_text, show_progress_bar=True))
+except Exception as e:
+    raise RuntimeError(f"Error generating teacher soft targets: {e}")
+
+# 软标签：对每个样本的每个类别各复制一行，用 (混合后的) 概率作为样本权重
+targets = teacher_probs.copy()
+num_labeled = len(train_idx)
+targets[:num_labeled] *= 1 - HARD_LABEL_WEIGHT
+targets[np.arange(num_labeled), y[train_idx]] += HARD_LABEL_WEIGHT
+
+X_rep = np.repeat(np.arange(len(X_train_text)), num_classes)
+y_rep = np.tile(np.arange(num_classes), len(X_train_text))
+w_rep = targets.ravel()
+
+# ------------------------------
+# Student: TF-IDF + LogisticRegression
+# ------------------------------
+vectorizer_student = TfidfVectorizer(max_features=5000,
+                                     ngram_range=(1, 2),
+                                     sublinear_tf=True)
+X_train_vec = vectorizer_student.fit_transform(X_train_text)
+X_test_vec = vectorizer_student.transform(X_test_text)
+
+clf_student = LogisticRegression(max_iter=2000, random_state=42)
+clf_student.fit(X_train_vec[X_rep], y_rep, sample_weight=w_rep)
+
+# ------------------------------
+# Report: accuracy, latency, memory
+# ------------------------------
+y_test = y[test_idx]
+
+
+def _per_ticket_latency_ms(predict_one, samples):
+    predict_one(samples[0])  # warm-up
+    start = time.perf_counter()
+    for s in samples:
+        predict_one(s)
+    return (time.perf_counter() - start) / len(samples) * 1000
+
+
+teacher_test_pred = teacher_clf.predict(sbert.encode(X_test_text))
+student_test_pred = clf_student.predict(X_test_vec)
+
+teacher_latency = _per_ticket_latency_ms(
+    lambda t: teacher_clf.predict(sbert.encode([t])), X_test_text)
+student_latency = _per_ticket_latency_ms(
+    lambda t: clf_student.predict(vectorizer_student.transform([t])), X_test_text)
+
+teacher_params = sum(p.numel() for p in sbert.parameters()) + teacher_clf.coef_.size + teacher_clf.intercept_.size
+student_params = clf_student.coef_.size + clf_student.intercept_.size
+teacher_bytes = sum(p.numel() * p.element_size() for p in sbert.parameters()) + len(pickle.dumps(teacher_clf))
+student_bytes = len(pickle.dumps(clf_student)) + len(pickle.dumps(vectorizer_student))
+
+print("\n=== Teacher (SBERT + LR) ===")
+print(classification_report(y_test, teacher_test_pred, target_names=sev_encoder.classes_))
+print("\n=== Student (TF-IDF + LR) ===")
+print(classification_report(y_test, student_test_pred, target_names=sev_encoder.classes_))
+
+report = {
+    "teacher": {
+        "backend": "sbert",
+        "sbert_model_name": sbert_model_name,
+        "test_accuracy": float(np.mean(teacher_test_pred == y_test)),
+        "latency_ms_per_ticket": teacher_latency,
+        "parameters": int(teacher_params),
+        "memory_bytes": int(teacher_bytes)
+    },
+    "student": {
+        "backend": "distilled",
+        "test_accuracy": float(np.mean(student_test_pred == y_test)),
+        "teacher_agreement": float(np.mean(student_test_pred == teacher_test_pred)),
+        "latency_ms_per_ticket": student_latency,
+        "parameters": int(student_params),
+        "memory_bytes": int(student_bytes)
+    },
+    "hard_label_weight": HARD_LABEL_WEIGHT,
+    "num_labeled_train": int(num_labeled),
+    "num_unlabeled_train": len(unlabeled_texts),
+    "num_test": len(test_idx),
+    "training_date": pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")
+}
+print("\n=== Distillation Report ===")
+print(json.dumps(report, indent=2))
+
+# write the drift-monitoring reference for the student, whose soft-target
+# confidences are flatter than the teacher's. Written before the registry
+# update so the student is never registered without its reference section.
+try:
+    write_reference_section(
+        registry.get("monitoring", {}).get("reference_profile"),
+        SEVERITY_REFERENCE_SECTIONS["distilled"],
+        df["severity"].value_counts(),
+        clf_student.predict_proba(X_test_vec).max(axis=1)
+    )
+except Exception as e:
+    raise RuntimeError(f"Error saving reference profile: {e}")
+
+# save the student model, vectorizer and report; register as an alternative backend
+try:
+    pickle.dump(clf_student, open("models/model_severity_distilled.pkl", "wb"))
+    pickle.dump(vectorizer_student, open("models/vectorizer_severity_distilled.pkl", "wb"))
+    with open("models/severity_distilled_report.json", "w") as f:
+        json.dump(report, f, indent=2)
+
+    registry["severity"]["distilled"] = {
+        "vectorizer": "models/vectorizer_severity_distilled.pkl",
+        "model": "models/model_severity_distilled.pkl"
+    }
+    registry["severity"].setdefault("backend", "sbert")
+    with open(REGISTRY_PATH, "w") as f:
+        json.dump(registry, f, indent=2)
+except Exception as e:
+    raise RuntimeError(f"Error saving distilled severity model: {e}")
+
+print("\nDistillation complete! Student saved in /models/")
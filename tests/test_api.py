@@ -319,4 +319,25 @@ def test_rate_limiting(client, mock_predictor):
     # 快速连续发送多个请求
     for i in range(5):
         response = client.post("/predict", json={"text": f"请求 {i}"})
-        assert response.status_code == 200
\ No newline at end of file
+        assert response.status_code == 200
+
+# ========== 漂移监控端点测试 ==========
+def test_get_drift_success(client, mock_predictor):
+    """测试获取漂移监控快照"""
+    app.state.predictor = mock_predictor
+    mock_predictor.monitor.snapshot.return_value = {"num_predictions": 3, "reference_loaded": True}
+
+    response = client.get("/drift")
+
+    assert response.status_code == 200
+    assert response.json() == {"num_predictions": 3, "reference_loaded": True}
+    mock_predictor.monitor.snapshot.assert_called_once()
+
+def test_get_drift_predictor_not_loaded(client):
+    """测试 predictor 未加载时获取漂移快照"""
+    app.state.predictor = None
+
+    response = client.get("/drift")
+
+    assert response.status_code == 503
+    assert response.json()["detail"] == "Predictor not loaded"
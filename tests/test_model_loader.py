@@ -0,0 +1,53 @@
+# test_model_loader.py
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.inference import model_loader
+
+# ========== Fixtures ==========
+def _write_registry(tmp_path, severity):
+    reg = {
+        "version": "v1.0",
+        "category": {"vectorizer": "v.pkl", "encoder": "e.pkl", "model": "m.pkl"},
+        "severity": severity,
+    }
+    path = tmp_path / "registry.json"
+    path.write_text(json.dumps(reg))
+    return str(path)
+
+# ========== 严重性后端测试 ==========
+def test_severity_backend_defaults_to_sbert(tmp_path, monkeypatch):
+    """测试未配置 backend 时默认使用 SBERT"""
+    path = _write_registry(tmp_path, {
+        "encoder": "models/encoder_severity.pkl",
+        "model": "models/model_severity.pkl",
+        "sbert_model_name": "all-mpnet-base-v2",
+    })
+    monkeypatch.setattr(model_loader, "REGISTRY_PATH", path)
+
+    reg = model_loader.load_latest_models()
+    assert reg["severity_backend"] == "sbert"
+    assert reg["severity_distilled_model"] is None
+    assert reg["reference_profile"] is None
+
+def test_severity_backend_distilled(tmp_path, monkeypatch):
+    """测试配置蒸馏学生模型作为严重性后端"""
+    path = _write_registry(tmp_path, {
+        "backend": "distilled",
+        "encoder": "models/encoder_severity.pkl",
+        "model": "models/model_severity.pkl",
+        "sbert_model_name": "all-mpnet-base-v2",
+        "distilled": {
+            "vectorizer": "models/vectorizer_severity_distilled.pkl",
+            "model": "models/model_severity_distilled.pkl",
+        },
+    })
+    monkeypatch.setattr(model_loader, "REGISTRY_PATH", path)
+
+    reg = model_loader.load_latest_models()
+    assert reg["severity_backend"] == "distilled"
+    assert reg["severity_distilled_vectorizer"] == "models/vectorizer_severity_distilled.pkl"
+    assert reg["severity_distilled_model"] == "models/model_severity_distilled.pkl"
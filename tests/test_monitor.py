@@ -0,0 +1,128 @@
+# test_monitor.py
+import json
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.inference.monitor import CONFIDENCE_BINS, DriftMonitor, load_reference_profile, write_reference_section
+
+# ========== Fixtures ==========
+def _reference():
+    hist = [0] * CONFIDENCE_BINS
+    hist[CONFIDENCE_BINS - 2] = 100  # 参考置信度集中在 0.90–0.95
+    return {
+        "category": {"counts": {"Email Issue": 50, "Network Issue": 50}, "confidence_histogram": hist},
+        "severity": {"counts": {"Low": 50, "High": 50}, "confidence_histogram": hist},
+    }
+
+# ========== 草图更新测试 ==========
+def test_record_updates_counters_and_histograms():
+    """测试记录预测后计数器与直方图更新"""
+    monitor = DriftMonitor()
+    monitor.record("Email Issue", "Low", 0.93, 0.41, "outlook down")
+    monitor.record("Email Issue", "High", 1.0, None, "vpn down")
+
+    assert monitor.num_predictions == 2
+    assert monitor.label_counts["category"] == {"Email Issue": 2}
+    assert monitor.label_counts["severity"] == {"Low": 1, "High": 1}
+    assert sum(monitor.confidence_histograms["category"]) == 2
+    assert monitor.confidence_histograms["category"][CONFIDENCE_BINS - 1] == 1
+    assert sum(monitor.confidence_histograms["severity"]) == 1
+
+def test_reservoir_is_bounded():
+    """测试文本蓄水池采样内存固定"""
+    monitor = DriftMonitor(reservoir_size=10, max_text_chars=5, seed=0)
+    for i in range(1000):
+        monitor.record("Email Issue", "Low", 0.5, 0.5, f"ticket {i}")
+
+    assert len(monitor.reservoir) == 10
+    assert all(len(t) <= 5 for t in monitor.reservoir)
+
+# ========== 漂移评分测试 ==========
+def test_snapshot_without_reference():
+    """测试没有参考分布时漂移分数为空"""
+    monitor = DriftMonitor()
+    monitor.record("Email Issue", "Low", 0.9, 0.9, "text")
+
+    snap = monitor.snapshot()
+    assert snap["reference_loaded"] is False
+    assert snap["category"]["label_drift"] is None
+    assert snap["category"]["confidence_drift_status"] == "unknown"
+
+def test_snapshot_stable_vs_drifted():
+    """测试分布一致与发生漂移时的评分"""
+    stable = DriftMonitor(reference=_reference())
+    drifted = DriftMonitor(reference=_reference())
+    for i in range(100):
+        label = "Email Issue" if i % 2 else "Network Issue"
+        stable.record(label, "Low" if i % 2 else "High", 0.92, 0.92)
+        drifted.record("Email Issue", "High", 0.3, 0.3)
+
+    s = stable.snapshot()
+    d = drifted.snapshot()
+    assert s["category"]["label_drift_status"] == "stable"
+    assert s["severity"]["confidence_drift_status"] == "stable"
+    assert d["category"]["label_drift_status"] == "significant"
+    assert d["severity"]["confidence_drift_status"] == "significant"
+    assert 0.25 <= d["category"]["confidence_quantiles"]["p50"] <= 0.35
+
+def test_load_reference_profile(tmp_path):
+    """测试参考分布文件加载"""
+    assert load_reference_profile(str(tmp_path / "missing.json")) is None
+
+    path = tmp_path / "reference_profile.json"
+    path.write_text(json.dumps(_reference()))
+    assert load_reference_profile(str(path))["category"]["counts"]["Email Issue"] == 50
+
+def test_write_reference_section_merges_sections(tmp_path):
+    """测试训练脚本写入参考分布时保留其他部分"""
+    path = str(tmp_path / "reference_profile.json")
+    write_reference_section(path, "category", {"Email Issue": 3}, [0.1, 0.95, 1.0])
+    write_reference_section(path, "severity", {"Low": 2}, [0.5, 0.5])
+
+    profile = load_reference_profile(path)
+    assert profile["category"]["counts"] == {"Email Issue": 3}
+    assert len(profile["category"]["confidence_histogram"]) == CONFIDENCE_BINS
+    assert profile["category"]["confidence_histogram"][CONFIDENCE_BINS - 1] == 2
+    assert sum(profile["severity"]["confidence_histogram"]) == 2
+
+def test_write_reference_section_accepts_value_counts(tmp_path):
+    """测试训练脚本传入的 pandas value_counts() 结果"""
+    path = str(tmp_path / "reference_profile.json")
+    counts = pd.Series(["High", "Low", "Low", "Medium"]).value_counts()
+    write_reference_section(path, "severity", counts, np.array([0.4, 0.6, 0.7, 0.9]))
+
+    profile = load_reference_profile(path)
+    assert profile["severity"]["counts"] == {"High": 1, "Low": 2, "Medium": 1}
+    assert profile["severity"]["num_samples"] == 4
+    assert sum(profile["severity"]["confidence_histogram"]) == 4
+
+# ========== 文本采样测试 ==========
+def test_snapshot_does_not_expose_texts():
+    """测试快照只返回采样数量，不返回原始文本"""
+    monitor = DriftMonitor(reservoir_size=5)
+    monitor.record("Email Issue", "Low", 0.5, 0.5, "secret ticket content")
+
+    snap = monitor.snapshot()
+    assert snap["text_sample_size"] == 1
+    assert "secret ticket content" not in json.dumps(snap)
+    assert monitor.sample() == ["secret ticket content"]
+
+def test_distilled_backend_uses_student_reference():
+    """测试蒸馏后端使用学生模型的参考分布"""
+    reference = _reference()
+    student_hist = [0] * CONFIDENCE_BINS
+    student_hist[10] = 100  # 学生模型置信度更平缓，集中在 0.50–0.55
+    reference["severity_distilled"] = {"counts": {"Low": 50, "High": 50}, "confidence_histogram": student_hist}
+
+    teacher = DriftMonitor(reference=reference)
+    student = DriftMonitor(reference=reference, severity_backend="distilled")
+    for i in range(100):
+        teacher.record("Email Issue", "Low" if i % 2 else "High", 0.92, 0.52)
+        student.record("Email Issue", "Low" if i % 2 else "High", 0.92, 0.52)
+
+    assert teacher.snapshot()["severity"]["confidence_drift_status"] == "significant"
+    assert student.snapshot()["severity"]["confidence_drift_status"] == "stable"
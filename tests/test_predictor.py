@@ -0,0 +1,131 @@
+# test_predictor.py
+import pytest
+from unittest.mock import Mock, patch
+import numpy as np
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.inference.predictor import Predictor
+
+# ========== Fixtures ==========
+def _registry(**overrides):
+    reg = {
+        "category_vectorizer": "models/vectorizer_category.pkl",
+        "category_model": "models/model_category.pkl",
+        "category_encoder": "models/encoder_category.pkl",
+        "severity_model": "models/model_severity.pkl",
+        "severity_encoder": "models/encoder_severity.pkl",
+        "sbert_model_name": "all-mpnet-base-v2",
+        "reference_profile": None,
+        "version": "v1.0",
+    }
+    reg.update(overrides)
+    return reg
+
+def _artifacts():
+    """按路径返回模拟的模型文件"""
+    category_model = Mock()
+    category_model.predict.return_value = np.array([1])
+    category_model.predict_proba.return_value = np.array([[0.2, 0.8]])
+    severity_model = Mock()
+    severity_model.predict.return_value = np.array([0])
+    severity_model.predict_proba.return_value = np.array([[0.6, 0.3, 0.1]])
+    return {
+        "models/vectorizer_category.pkl": Mock(),
+        "models/model_category.pkl": category_model,
+        "models/encoder_category.pkl": Mock(classes_=["Email Issue", "Network Issue"]),
+        "models/model_severity.pkl": severity_model,
+        "models/encoder_severity.pkl": Mock(classes_=["High", "Low", "Medium"]),
+    }
+
+@pytest.fixture
+def artifacts():
+    return _artifacts()
+
+@pytest.fixture
+def predictor(artifacts):
+    """使用模拟模型创建 Predictor（默认 SBERT 后端）"""
+    with patch("src.inference.predictor.load_latest_models", return_value=_registry()), \
+         patch("src.inference.predictor._safe_load", side_effect=lambda path: artifacts[path]), \
+         patch("src.inference.predictor.SentenceTransformer"):
+        yield Predictor()
+
+# ========== 漂移监控记录测试 ==========
+def test_predict_records_into_monitor(predictor):
+    """测试每次预测都写入漂移监控"""
+    for _ in range(3):
+        result = predictor.predict("Outlook is not receiving emails")
+
+    assert result["category"] == "Network Issue"
+    assert result["severity"] == "High"
+
+    monitor = predictor.monitor
+    assert monitor.num_predictions == 3
+    assert monitor.label_counts["category"] == {"Network Issue": 3}
+    assert monitor.label_counts["severity"] == {"High": 3}
+    # cat_prob = 0.8, sev_prob = 0.6
+    assert monitor.confidence_histograms["category"][16] == 3
+    assert monitor.confidence_histograms["severity"][12] == 3
+    assert monitor.sample() == ["Outlook is not receiving emails"] * 3
+
+def test_predict_error_is_not_recorded(predictor, artifacts):
+    """测试预测失败时不写入漂移监控"""
+    artifacts["models/model_severity.pkl"].predict.side_effect = Exception("boom")
+
+    with pytest.raises(RuntimeError):
+        predictor.predict("VPN login fails")
+
+    assert predictor.monitor.num_predictions == 0
+    assert predictor.monitor.label_counts["severity"] == {}
+
+# ========== 严重性后端测试 ==========
+def test_sbert_backend_default(predictor, artifacts):
+    """测试默认 SBERT 后端使用句向量作为严重性特征"""
+    assert predictor.severity_backend == "sbert"
+    assert predictor.severity_vectorizer is None
+
+    predictor.predict("VPN login fails")
+
+    predictor.sbert_model.encode.assert_called_once_with(["VPN login fails"])
+    sev_features = artifacts["models/model_severity.pkl"].predict.call_args[0][0]
+    assert sev_features is predictor.sbert_model.encode.return_value
+
+def test_distilled_backend_skips_sbert():
+    """测试蒸馏后端不加载 SBERT，使用学生模型的 TF-IDF 特征"""
+    artifacts = _artifacts()
+    student = artifacts.pop("models/model_severity.pkl")
+    artifacts["models/model_severity_distilled.pkl"] = student
+    artifacts["models/vectorizer_severity_distilled.pkl"] = Mock()
+    registry = _registry(
+        severity_backend="distilled",
+        severity_distilled_model="models/model_severity_distilled.pkl",
+        severity_distilled_vectorizer="models/vectorizer_severity_distilled.pkl",
+    )
+
+    with patch("src.inference.predictor.load_latest_models", return_value=registry), \
+         patch("src.inference.predictor._safe_load", side_effect=lambda path: artifacts[path]), \
+         patch("src.inference.predictor.SentenceTransformer") as mock_sbert:
+        predictor = Predictor()
+        result = predictor.predict("VPN login fails")
+
+    mock_sbert.assert_not_called()
+    assert predictor.sbert_model is None
+    assert predictor.severity_model is student
+
+    vectorizer = artifacts["models/vectorizer_severity_distilled.pkl"]
+    vectorizer.transform.assert_called_once_with(["VPN login fails"])
+    assert student.predict.call_args[0][0] is vectorizer.transform.return_value
+    assert result["severity"] == "High"
+    assert predictor.monitor.reference_sections["severity"] == "severity_distilled"
+
+def test_unknown_backend_raises():
+    """测试未知的严重性后端"""
+    with patch("src.inference.predictor.load_latest_models", return_value=_registry(severity_backend="bert-tiny")), \
+         patch("src.inference.predictor._safe_load", side_effect=lambda path: _artifacts()[path]), \
+         patch("src.inference.predictor.SentenceTransformer") as mock_sbert:
+        with pytest.raises(ValueError, match="Unknown severity backend"):
+            Predictor()
+
+    mock_sbert.assert_not_called()